@@ -49,6 +49,8 @@ if __name__ == "__main__":
     _maybe_detach()
 
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 from typing import Any
 
@@ -90,6 +92,9 @@ logger = logging.getLogger(__name__)
 
 PANELS_DIR = Path(__file__).parent / "ui" / "panels"
 
+# Set to any non-empty value to log at DEBUG instead of WARNING.
+_DEBUG_ENV = "LISCRIBE_DEBUG"
+
 # Panels that, when open, show the app in the Dock. Dictate is excluded (menu bar only when only dictate is open).
 DOCK_PANELS = frozenset({"settings", "onboarding", "scribe", "transcribe"})
 
@@ -488,7 +493,8 @@ class LiscribeApp(rumps.App):
         def _on_closed() -> None:
             if name == "scribe":
                 if self._scribe_ctrl.state in (ControllerState.RECORDING, ControllerState.TRANSCRIBING):
-                    self._scribe_ctrl.cancel()
+                    # Window is gone; don't hold the main thread while streams close.
+                    self._scribe_ctrl.cancel(wait=False)
             if name == "transcribe":
                 if self._transcribe_ctrl.state == TranscribeState.TRANSCRIBING:
                     self._transcribe_ctrl.cancel()
@@ -892,8 +898,25 @@ class LiscribeApp(rumps.App):
         )
 
 
+def _configure_logging() -> None:
+    """Route all log records through a queue drained by a background listener.
+
+    The recorder logs stream status (xruns) from the PortAudio callback thread;
+    with a QueueHandler that is a queue put, and the stderr write happens on
+    the listener thread instead of the audio or main thread.
+    """
+    level = logging.DEBUG if os.environ.get(_DEBUG_ENV) else logging.WARNING
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    logging.basicConfig(level=level, handlers=[logging.handlers.QueueHandler(log_queue)])
+    listener.start()
+    atexit.register(listener.stop)
+
+
 def main() -> None:
-    logging.basicConfig(level=logging.WARNING)
+    _configure_logging()
     _set_process_display_name(APP_DISPLAY_NAME)
 
     def activate_on_main_thread() -> None:
@@ -909,6 +932,8 @@ def main() -> None:
 
     config = ConfigService()
     audio = AudioService(config)
+    # A discarded Scribe session may still be deleting its WAV; finish before exit.
+    atexit.register(audio.wait_for_discard)
     model = ModelService(config)
     hotkey = HotkeyService(config)
 
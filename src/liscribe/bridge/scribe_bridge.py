@@ -81,6 +81,18 @@ class ScribeBridge:
         except Exception as e:
             logger.warning("list_mics failed (returning empty list): %s", e, exc_info=True)
             mics = []
+        return self._annotate_mics(mics)
+
+    def refresh_mics(self) -> list[dict]:
+        """Like get_mics, but re-enumerates devices instead of using the cached list."""
+        try:
+            mics = self._audio.refresh_mics()
+        except Exception as e:
+            logger.warning("refresh_mics failed (returning empty list): %s", e, exc_info=True)
+            mics = []
+        return self._annotate_mics(mics)
+
+    def _annotate_mics(self, mics: list[dict]) -> list[dict]:
         is_fallback = self._controller.is_using_fallback_mic
         return [
             {**mic, "is_fallback_active": is_fallback}
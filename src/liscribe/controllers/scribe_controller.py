@@ -92,6 +92,7 @@ class ScribeController:
         self._speaker_enabled: bool = False
         self._save_path: str | None = None
         self._is_using_fallback_mic: bool = False
+        self._start_mono: float | None = None
 
         self._progress: list[ModelProgress] = []
         self._result: ScribeResult | None = None
@@ -158,6 +159,7 @@ class ScribeController:
 
         self._cancelled = False
         self._notes = NoteCollection()
+        self._start_mono = None
         self._audio.start(mic=self._current_mic, speaker=self._speaker_enabled)
 
         start_time = self._audio.get_session_start_time()
@@ -266,10 +268,11 @@ class ScribeController:
         thread.start()
         return result
 
-    def cancel(self) -> None:
+    def cancel(self, wait: bool = True) -> None:
         """Discard the active recording without saving anything.
 
-        Safe to call in any state, including IDLE.
+        Safe to call in any state, including IDLE. wait=False hands the audio
+        teardown to a background thread (see AudioService.cancel).
         When in TRANSCRIBING, sets _cancelled so the background thread
         does not overwrite state to DONE.
 
@@ -281,7 +284,7 @@ class ScribeController:
             return
 
         if self._state == ControllerState.RECORDING:
-            self._audio.cancel()
+            self._audio.cancel(wait=wait)
         with self._lock:
             self._cancelled = True
         self._notes = NoteCollection()
@@ -442,10 +445,15 @@ class ScribeController:
         """Return seconds elapsed since recording started, or 0.0."""
         if self._state != ControllerState.RECORDING:
             return 0.0
-        start = self._audio.get_session_start_time()
-        if start is None:
-            return 0.0
-        return time.time() - start
+        if self._start_mono is None:
+            start = self._audio.get_session_start_time()
+            if start is None:
+                return 0.0
+            # The recorder stamps its start with time.time(); translate it to the
+            # monotonic clock once so a wall-clock (NTP) adjustment mid-recording
+            # cannot make the timer jump.
+            self._start_mono = time.monotonic() - (time.time() - start)
+        return time.monotonic() - self._start_mono
 
     def get_transcription_progress(self) -> list[dict]:
         """Return a JSON-serialisable snapshot of per-model progress."""
@@ -21,6 +21,26 @@ from liscribe.recorder import (
 )
 from liscribe.services.config_service import ConfigService
 
+# Scales block RMS into the 0.0–1.0 display range (speech RMS sits well below 0.1).
+_LEVEL_GAIN = 10.0
+
+
+def _rms_levels(chunk: np.ndarray, bars: int) -> list[float]:
+    """Split chunk into bars equal segments and return each segment's scaled RMS.
+
+    One reshape and three ufunc reductions instead of a Python loop per bar.
+    Trailing samples that do not fill a whole segment are ignored; when the
+    chunk is shorter than bars, the bars past its end are 0.0.
+    """
+    n = len(chunk)
+    if n == 0:
+        return [0.0] * bars
+    bar_size = max(1, n // bars)
+    used = min(bars, n // bar_size)
+    segments = chunk[: used * bar_size].reshape(used, bar_size)
+    rms = np.sqrt(np.mean(np.square(segments), axis=1))
+    return np.minimum(1.0, rms * _LEVEL_GAIN).tolist() + [0.0] * (bars - used)
+
 
 class AudioService:
     """Manages one active recording session at a time.
@@ -35,14 +55,35 @@ class AudioService:
         self._thread: threading.Thread | None = None
         self._wav_path: str | None = None
         self._run_error: Exception | None = None
+        self._mics_cache: list[dict[str, Any]] | None = None
+        self._discard_thread: threading.Thread | None = None
 
     # ------------------------------------------------------------------
     # Device enumeration
     # ------------------------------------------------------------------
 
     def list_mics(self) -> list[dict[str, Any]]:
-        """Return available input devices."""
-        return list_input_devices()
+        """Return available input devices.
+
+        While a session is recording, a non-empty PortAudio enumeration is
+        taken once and reused: the Scribe panel asks for the list on load and
+        again on its retry (which also fires when only the model list came
+        back empty), and each scan walks the host API tables alongside the
+        live stream callback. An empty result is never kept, so a retry after
+        an empty load enumerates again. The snapshot is dropped on start(),
+        stop(), refresh_mics() and a failed switch_mic(). When idle, every
+        call enumerates afresh.
+        """
+        if self._session is None:
+            return list_input_devices()
+        if not self._mics_cache:
+            self._mics_cache = list_input_devices()
+        return list(self._mics_cache)
+
+    def refresh_mics(self) -> list[dict[str, Any]]:
+        """Drop the cached device list and return a fresh enumeration."""
+        self._mics_cache = None
+        return self.list_mics()
 
     def preferred_mic_index(self) -> int | None:
         """Return the saved default mic index, or None for system default."""
@@ -71,12 +112,14 @@ class AudioService:
         When save_folder_override is set, recordings are saved there instead of
         config.save_folder (e.g. for ephemeral Dictate sessions).
         """
+        self.wait_for_discard()
         if self.is_recording:
             raise RuntimeError("A recording session is already active.")
 
         folder = save_folder_override if save_folder_override is not None else self._config.save_folder
         self._session = RecordingSession(folder=folder, speaker=speaker, mic=mic)
         self._wav_path = None
+        self._mics_cache = None
         self._thread = threading.Thread(target=self._run, daemon=True, name="audio-recorder")
         self._thread.start()
 
@@ -112,20 +155,36 @@ class AudioService:
         self._thread = None
         self._wav_path = None
         self._run_error = None
+        self._mics_cache = None
         if run_error is not None:
             raise run_error
         return path
 
-    def cancel(self) -> None:
+    def cancel(self, wait: bool = True) -> None:
         """Stop the active recording and delete any saved files from disk.
 
         In single-stream mode, deletes the WAV file.
         In dual-source mode, deletes the entire session directory
         (mic.wav + speaker.wav + session.json).
 
+        With wait=False the stop (stream close and WAV write) and the deletion
+        run on a background thread so a closing panel does not block the main
+        thread; the next start() and process exit wait for that thread.
+
         Safe to call in any state — exceptions from stop() are caught and
         logged rather than re-raised, since we are discarding the artifact.
         """
+        if not wait:
+            if self._session is None:
+                return
+            self.wait_for_discard()
+            # Not a daemon: a quit right after "discard" must not kill the
+            # thread before the WAV is deleted (app.py also joins it at exit).
+            self._discard_thread = threading.Thread(
+                target=self.cancel, name="audio-discard"
+            )
+            self._discard_thread.start()
+            return
         try:
             path_str = self.stop()
         except Exception as exc:
@@ -142,6 +201,14 @@ class AudioService:
             p.unlink(missing_ok=True)
             logger.info("Discarded recording: %s", p)
 
+    def wait_for_discard(self) -> None:
+        """Block until a background cancel(wait=False) has finished, if one is running."""
+        thread = self._discard_thread
+        if thread is None or thread is threading.current_thread():
+            return
+        thread.join()
+        self._discard_thread = None
+
     # ------------------------------------------------------------------
     # Mid-session controls (Phase 4)
     # ------------------------------------------------------------------
@@ -160,6 +227,8 @@ class AudioService:
             idx = resolve_device(mic_name)
         except ValueError as exc:
             logger.warning("Cannot switch mic: %s", exc)
+            # The device list the user picked from is stale (e.g. unplugged).
+            self._mics_cache = None
             return
         self._session.switch_mic(idx)
 
@@ -196,32 +265,29 @@ class AudioService:
         (length 2*bars) so the UI can show two rows. When speaker is off or
         has no data yet, returns mic levels only (length bars).
         """
-        if self._session is None:
+        # Local reference: a background discard may clear self._session meanwhile.
+        session = self._session
+        if session is None:
             return []
-        with self._session._lock:
-            if not self._session._mic_chunks:
-                return [0.0] * bars
-            mic_chunk = self._session._mic_chunks[-1].flatten()
-            speaker_chunk = None
-            if self._session.speaker and self._session._speaker_chunks:
-                speaker_chunk = self._session._speaker_chunks[-1].flatten()
-
-        def _levels_from_chunk(chunk: np.ndarray) -> list[float]:
-            if len(chunk) == 0:
+        # The recorder callback appends a fresh copy per block and never mutates
+        # it afterwards, so only the list lookup needs the lock the PortAudio
+        # thread also takes; flattening and RMS happen after releasing it.
+        with session._lock:
+            if not session._mic_chunks:
                 return [0.0] * bars
-            bar_size = max(1, len(chunk) // bars)
-            out: list[float] = []
-            for i in range(bars):
-                segment = chunk[i * bar_size : (i + 1) * bar_size]
-                rms = float(np.sqrt(np.mean(np.square(segment)))) if len(segment) > 0 else 0.0
-                out.append(min(1.0, rms * 10.0))
-            return out
-
-        mic_levels = _levels_from_chunk(mic_chunk)
-        if self._session.speaker:
+            mic_block = session._mic_chunks[-1]
+            speaker_on = bool(session.speaker)
+            speaker_block = None
+            if speaker_on and session._speaker_chunks:
+                speaker_block = session._speaker_chunks[-1]
+        # ravel() is a view for the C-contiguous blocks the recorder stores.
+        mic_chunk = mic_block.ravel()
+        speaker_chunk = speaker_block.ravel() if speaker_block is not None else None
+
+        levels = _rms_levels(mic_chunk, bars)
+        if speaker_on:
             if speaker_chunk is not None:
-                speaker_levels = _levels_from_chunk(speaker_chunk)
+                levels += _rms_levels(speaker_chunk, bars)
             else:
-                speaker_levels = [0.0] * bars
-            return mic_levels + speaker_levels
-        return mic_levels
+                levels += [0.0] * bars
+        return levels
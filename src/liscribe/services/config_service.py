@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -519,8 +520,13 @@ class ConfigService:
             try:
                 data = json.loads(UI_PREFS_PATH.read_text(encoding="utf-8"))
             except Exception:
-                pass
+                logger.debug("Could not read ui_prefs.json; rewriting it", exc_info=True)
         data[START_ON_LOGIN_KEY] = value
-        UI_PREFS_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        # Dump straight to a sibling temp file and rename it over the original,
+        # so a crash mid-write never leaves a truncated ui_prefs.json behind.
+        tmp_path = UI_PREFS_PATH.with_name(UI_PREFS_PATH.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, UI_PREFS_PATH)
         logger.debug("Saved start_on_login=%s to %s", value, UI_PREFS_PATH)
         _set_login_item(value)
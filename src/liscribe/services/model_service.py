@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable
 
@@ -21,6 +22,9 @@ from liscribe.services.config_service import ConfigService
 
 logger = logging.getLogger(__name__)
 
+# Smallest progress change forwarded to on_progress callbacks (one percent).
+_PROGRESS_STEP = 0.01
+
 
 def _load_dual_source_session(audio_path: Path) -> dict | None:
     """Return dual-source session details when *audio_path* points to session mic.wav."""
@@ -29,15 +33,22 @@ def _load_dual_source_session(audio_path: Path) -> dict | None:
     session_dir = audio_path.parent
     speaker_path = session_dir / "speaker.wav"
     session_json_path = session_dir / "session.json"
-    if not speaker_path.exists() or not session_json_path.exists():
+    if not speaker_path.exists():
+        return None
+    try:
+        raw_meta: str | None = session_json_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return None
+    except (OSError, ValueError):
+        logger.warning("Could not read %s; assuming no speaker offset", session_json_path, exc_info=True)
+        raw_meta = None
 
     offset = 0.0
-    try:
-        session_meta = json.loads(session_json_path.read_text(encoding="utf-8"))
-        offset = float(session_meta.get("offset_correction_seconds", 0.0))
-    except Exception:
-        offset = 0.0
+    if raw_meta is not None:
+        try:
+            offset = float(json.loads(raw_meta).get("offset_correction_seconds", 0.0))
+        except (ValueError, TypeError, AttributeError):
+            logger.warning("Malformed %s; assuming no speaker offset", session_json_path, exc_info=True)
 
     return {
         "session_dir": session_dir,
@@ -76,15 +87,16 @@ class ModelService:
         """Return all known models with download status.
 
         Each dict has keys: name, is_downloaded, size_label.
+        Always checks disk.
         """
-        return [
-            {
+        models = []
+        for name in WHISPER_MODEL_ORDER:
+            models.append({
                 "name": name,
                 "is_downloaded": _transcriber.is_model_available(name),
                 "size_label": self._SIZE_LABELS.get(name, ""),
-            }
-            for name in WHISPER_MODEL_ORDER
-        ]
+            })
+        return models
 
     def list_models_fast(self) -> list[dict]:
         """Return model list without checking disk. Same shape as list_models().
@@ -102,6 +114,15 @@ class ModelService:
         ]
 
     def is_downloaded(self, model: str) -> bool:
+        """Return whether *model* can be used without a download.
+
+        A model already loaded in memory is answered without touching disk:
+        transcribe() reuses it, so files deleted outside the app cannot
+        trigger a download. Any other model is probed on every call, so the
+        guards in dictate start and stop-and-save never act on a stale result.
+        """
+        if model in self._loaded_models:
+            return True
         return _transcriber.is_model_available(model)
 
     def get_model_cache_dir(self, model: str) -> Path:
@@ -146,8 +167,9 @@ class ModelService:
         """Transcribe an audio file. Loads model if not already loaded.
 
         When wav_path points to a dual-source session (mic.wav with speaker.wav
-        and session.json in the same dir), transcribes both streams, merges
-        with source labels and mic-bleed dedup, and returns the merged result.
+        and session.json in the same dir), transcribes both streams concurrently,
+        merges with source labels and mic-bleed dedup, and returns the merged
+        result.
 
         Blocks the calling thread. Run in a worker thread from controllers.
         """
@@ -160,30 +182,52 @@ class ModelService:
 
         model = self._loaded_models[model_size]
 
+        last_reported = -1.0
+
         def _progress(progress: float, info: dict | None = None) -> None:
-            if on_progress:
-                on_progress(progress)
+            # The engine reports once per segment; panels poll far slower and
+            # show whole percents, so forward only visible steps (and the end).
+            nonlocal last_reported
+            if not on_progress:
+                return
+            if progress < 1.0 and progress - last_reported < _PROGRESS_STEP:
+                return
+            last_reported = progress
+            on_progress(progress)
 
         dual = _load_dual_source_session(wav_path)
         if dual is not None:
-            def mic_progress(p: float, info: dict | None = None) -> None:
-                _progress(p * 0.5)
-
-            def speaker_progress(p: float, info: dict | None = None) -> None:
-                _progress(0.5 + p * 0.5)
-
-            mic_result = _transcriber.transcribe(
-                audio_path=dual["mic_audio_path"],
-                model=model,
-                model_size=model_size,
-                on_progress=mic_progress if on_progress else None,
-            )
-            speaker_result = _transcriber.transcribe(
-                audio_path=dual["speaker_audio_path"],
-                model=model,
-                model_size=model_size,
-                on_progress=speaker_progress if on_progress else None,
-            )
+            # The two streams are independent until the merge, so the speaker
+            # track runs on a helper thread: its decode, resample and VAD overlap
+            # the mic pass. CTranslate2 releases the GIL and serialises
+            # concurrent calls on the shared model itself.
+            lane_progress = [0.0, 0.0]
+            lane_lock = threading.Lock()
+
+            def _lane(index: int) -> Callable[..., None]:
+                def _on_lane(p: float, info: dict | None = None) -> None:
+                    with lane_lock:
+                        lane_progress[index] = p
+                        _progress(sum(lane_progress) * 0.5)
+                return _on_lane
+
+            with ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="transcribe-speaker"
+            ) as pool:
+                speaker_future = pool.submit(
+                    _transcriber.transcribe,
+                    audio_path=dual["speaker_audio_path"],
+                    model=model,
+                    model_size=model_size,
+                    on_progress=_lane(1) if on_progress else None,
+                )
+                mic_result = _transcriber.transcribe(
+                    audio_path=dual["mic_audio_path"],
+                    model=model,
+                    model_size=model_size,
+                    on_progress=_lane(0) if on_progress else None,
+                )
+                speaker_result = speaker_future.result()
             return build_merged_transcription_result(
                 mic_result=mic_result,
                 speaker_result=speaker_result,
@@ -212,8 +212,13 @@ class _OverlayController(NSObject):
         self._timer = None
         self._done_timer = None
         self._tick_count = 0
+        self._elapsed_sec = -1
+        self._status_prefix = ""
+        self._last_text = ""
+        self._buttons_hidden: bool | None = None
         self._dictate_ctrl = None
         self._hotkey_display = "^"
+        self._stop_hint = ""
         self._on_cancel = None
         self._on_done = None
         self._showing_done_toast = False
@@ -223,6 +228,7 @@ class _OverlayController(NSObject):
     def setup(self, ctrl: object, hotkey: str, on_cancel: Callable[[], None], on_done: Callable[[], None] | None = None) -> None:
         self._dictate_ctrl = ctrl
         self._hotkey_display = hotkey or "^"
+        self._stop_hint = f" — {self._hotkey_display} to stop"
         self._on_cancel = on_cancel
         self._on_done = on_done
 
@@ -326,6 +332,9 @@ class _OverlayController(NSObject):
         self._done_btn = done_btn
         self._btn = btn
         self._tick_count = 0
+        self._elapsed_sec = -1
+        self._last_text = ""
+        self._buttons_hidden = None
 
         self._timer = AppKit.NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
             _TICK_INTERVAL, self, "tick:", None, True
@@ -342,27 +351,39 @@ class _OverlayController(NSObject):
             self._tick_count += 1
             ui_state = ctrl.get_ui_state()
             if ui_state == "recording":
-                elapsed = ctrl.get_elapsed()
+                # 9 of 10 ticks fall within the same second; reuse its text.
+                elapsed_sec = int(ctrl.get_elapsed())
+                if elapsed_sec != self._elapsed_sec:
+                    self._elapsed_sec = elapsed_sec
+                    self._status_prefix = f"● {_format_elapsed(elapsed_sec)}  "
                 levels = ctrl.get_waveform(bars=_N_BARS)
                 wave = _render_waveform(levels)
-                text = f"● {_format_elapsed(elapsed)}  {wave} — {self._hotkey_display} to stop"
-                if self._btn is not None:
-                    self._btn.setHidden_(False)
-                if self._done_btn is not None:
-                    self._done_btn.setHidden_(False)
+                # Only the waveform glyphs vary between ticks; prefix and hint are cached.
+                text = self._status_prefix + wave + self._stop_hint
+                self._set_buttons_hidden(False)
             elif ui_state == "processing":
                 dots = "." * (self._tick_count % 4)
                 text = f"◌ Transcribing{dots:<3}"
-                if self._btn is not None:
-                    self._btn.setHidden_(True)
-                if self._done_btn is not None:
-                    self._done_btn.setHidden_(True)
+                self._set_buttons_hidden(True)
             else:
                 return
-            self._label.setStringValue_(text)
+            # Skip the AppKit relayout when the label would not change.
+            if text != self._last_text:
+                self._last_text = text
+                self._label.setStringValue_(text)
         except Exception:
             logger.debug("_OverlayController.tick_ error", exc_info=True)
 
+    @objc.python_method
+    def _set_buttons_hidden(self, hidden: bool) -> None:
+        if hidden == self._buttons_hidden:
+            return
+        self._buttons_hidden = hidden
+        if self._btn is not None:
+            self._btn.setHidden_(hidden)
+        if self._done_btn is not None:
+            self._done_btn.setHidden_(hidden)
+
     def cancelAction_(self, sender: object) -> None:
         try:
             if self._on_cancel is not None:
@@ -387,10 +408,8 @@ class _OverlayController(NSObject):
         self._showing_done_toast = True
         if self._label is not None:
             self._label.setStringValue_("✓ Copied to clipboard")
-        if self._btn is not None:
-            self._btn.setHidden_(True)
-        if self._done_btn is not None:
-            self._done_btn.setHidden_(True)
+            self._last_text = ""
+        self._set_buttons_hidden(True)
         # Cancel the repeating tick timer so it does not interfere with toast.
         if self._timer is not None:
             self._timer.invalidate()
@@ -0,0 +1,65 @@
+"""Tests for app.py startup helpers — logging configuration."""
+
+from __future__ import annotations
+
+import logging
+import logging.handlers
+import sys
+
+import pytest
+
+if sys.platform != "darwin":
+    pytest.skip("app.py requires macOS", allow_module_level=True)
+pytest.importorskip("rumps")
+pytest.importorskip("webview")
+
+from liscribe import app  # noqa: E402
+
+
+@pytest.fixture()
+def configure_logging(monkeypatch):
+    """Run _configure_logging on a bare root logger; restore it and stop the listener after."""
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    stops = []
+    monkeypatch.setattr(app.atexit, "register", stops.append)
+
+    def run() -> list:
+        # basicConfig is a no-op while root has handlers (pytest adds its own).
+        root.handlers = []
+        app._configure_logging()
+        return stops
+
+    yield run
+    for stop in stops:
+        stop()
+    root.handlers = saved_handlers
+    root.setLevel(saved_level)
+
+
+class TestConfigureLogging:
+    def test_installs_queue_handler_on_root(self, configure_logging, monkeypatch):
+        monkeypatch.delenv(app._DEBUG_ENV, raising=False)
+        configure_logging()
+        handlers = logging.getLogger().handlers
+        assert len(handlers) == 1
+        assert isinstance(handlers[0], logging.handlers.QueueHandler)
+
+    def test_level_is_warning_by_default(self, configure_logging, monkeypatch):
+        monkeypatch.delenv(app._DEBUG_ENV, raising=False)
+        configure_logging()
+        assert logging.getLogger().level == logging.WARNING
+
+    def test_debug_env_enables_debug_level(self, configure_logging, monkeypatch):
+        monkeypatch.setenv(app._DEBUG_ENV, "1")
+        configure_logging()
+        assert logging.getLogger().level == logging.DEBUG
+
+    def test_record_reaches_listener_stream(self, configure_logging, monkeypatch, capsys):
+        monkeypatch.delenv(app._DEBUG_ENV, raising=False)
+        stops = configure_logging()
+        logging.getLogger("liscribe.test").warning("stream %s", "check")
+        for stop in stops:
+            stop()  # drains the queue before returning
+        stops.clear()
+        assert "WARNING:liscribe.test:stream check" in capsys.readouterr().err
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
+import textwrap
 import threading
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
-from liscribe.services.audio_service import AudioService
+from liscribe.services.audio_service import AudioService, _rms_levels
 from liscribe.services.config_service import ConfigService
 
 
@@ -51,6 +56,72 @@ class TestListMics:
         m.assert_called_once()
         assert result == expected
 
+    def test_idle_calls_enumerate_each_time(self, svc):
+        with patch("liscribe.services.audio_service.list_input_devices", return_value=[]) as m:
+            svc.list_mics()
+            svc.list_mics()
+        assert m.call_count == 2
+
+    def test_active_session_reuses_snapshot(self, svc):
+        _mock_active_session(svc, "/tmp/test.wav")
+        expected = [{"index": 0, "name": "Built-in Mic"}]
+        with patch("liscribe.services.audio_service.list_input_devices", return_value=expected) as m:
+            first = svc.list_mics()
+            second = svc.list_mics()
+        m.assert_called_once()
+        assert first == second == expected
+
+    def test_empty_enumeration_is_not_reused(self, svc):
+        _mock_active_session(svc, "/tmp/test.wav")
+        populated = [{"index": 0, "name": "Built-in Mic"}]
+        with patch(
+            "liscribe.services.audio_service.list_input_devices",
+            side_effect=[[], populated, []],
+        ) as m:
+            assert svc.list_mics() == []
+            assert svc.list_mics() == populated
+            assert svc.list_mics() == populated
+        assert m.call_count == 2
+
+    def test_snapshot_is_copied_to_callers(self, svc):
+        _mock_active_session(svc, "/tmp/test.wav")
+        with patch("liscribe.services.audio_service.list_input_devices", return_value=[{"index": 0}]):
+            svc.list_mics().append({"index": 99})
+            assert svc.list_mics() == [{"index": 0}]
+
+    def test_successful_switch_mic_keeps_snapshot(self, svc):
+        _mock_active_session(svc, "/tmp/test.wav")
+        with patch("liscribe.services.audio_service.list_input_devices", return_value=[{"index": 0}]) as m, \
+             patch("liscribe.recorder.resolve_device", return_value=1):
+            svc.list_mics()
+            svc.switch_mic("USB Mic")
+            svc.list_mics()
+        m.assert_called_once()
+
+    def test_failed_switch_mic_drops_snapshot(self, svc):
+        _mock_active_session(svc, "/tmp/test.wav")
+        with patch("liscribe.services.audio_service.list_input_devices", return_value=[]) as m, \
+             patch("liscribe.recorder.resolve_device", side_effect=ValueError("gone")):
+            svc.list_mics()
+            svc.switch_mic("USB Mic")
+            svc.list_mics()
+        assert m.call_count == 2
+
+    def test_refresh_mics_re_enumerates(self, svc):
+        _mock_active_session(svc, "/tmp/test.wav")
+        with patch("liscribe.services.audio_service.list_input_devices", return_value=[{"index": 0}]) as m:
+            svc.list_mics()
+            svc.refresh_mics()
+            svc.list_mics()
+        assert m.call_count == 2
+
+    def test_stop_drops_snapshot(self, svc):
+        _mock_active_session(svc, "/tmp/test.wav")
+        with patch("liscribe.services.audio_service.list_input_devices", return_value=[]):
+            svc.list_mics()
+        svc.stop()
+        assert svc._mics_cache is None
+
 
 # ---------------------------------------------------------------------------
 # is_recording
@@ -130,6 +201,60 @@ class TestGetLevels:
         result = svc.get_levels()
         assert result == [0.0] * 30
 
+    def test_levels_from_latest_mic_chunk(self, svc):
+        _mock_active_session(svc, "/tmp/rec.wav")
+        svc._session._lock = threading.Lock()
+        svc._session.speaker = False
+        svc._session._mic_chunks = [
+            np.zeros((1024, 1), dtype=np.float32),
+            np.full((1024, 1), 0.05, dtype=np.float32),
+        ]
+        result = svc.get_levels(bars=4)
+        assert result == pytest.approx([0.5] * 4)
+
+    def test_lock_released_after_levels(self, svc):
+        _mock_active_session(svc, "/tmp/rec.wav")
+        svc._session._lock = threading.Lock()
+        svc._session.speaker = False
+        svc._session._mic_chunks = [np.full((1024, 1), 0.05, dtype=np.float32)]
+        svc.get_levels()
+        assert not svc._session._lock.locked()
+
+    def test_speaker_levels_appended_when_enabled(self, svc):
+        _mock_active_session(svc, "/tmp/rec.wav")
+        svc._session._lock = threading.Lock()
+        svc._session.speaker = True
+        svc._session._mic_chunks = [np.full((1024, 1), 0.05, dtype=np.float32)]
+        svc._session._speaker_chunks = [np.zeros((1024, 1), dtype=np.float32)]
+        result = svc.get_levels(bars=4)
+        assert result == pytest.approx([0.5] * 4 + [0.0] * 4)
+
+
+class TestRmsLevels:
+    @staticmethod
+    def _reference(chunk, bars):
+        bar_size = max(1, len(chunk) // bars)
+        out = []
+        for i in range(bars):
+            segment = chunk[i * bar_size : (i + 1) * bar_size]
+            rms = float(np.sqrt(np.mean(np.square(segment)))) if len(segment) > 0 else 0.0
+            out.append(min(1.0, rms * 10.0))
+        return out
+
+    def test_matches_per_bar_loop(self):
+        chunk = np.random.default_rng(0).uniform(-0.2, 0.2, 1024).astype(np.float32)
+        assert _rms_levels(chunk, 30) == pytest.approx(self._reference(chunk, 30), abs=1e-6)
+
+    def test_chunk_shorter_than_bars_pads_with_zeros(self):
+        chunk = np.full(5, 0.05, dtype=np.float32)
+        assert _rms_levels(chunk, 8) == pytest.approx([0.5] * 5 + [0.0] * 3)
+
+    def test_empty_chunk(self):
+        assert _rms_levels(np.empty(0, dtype=np.float32), 3) == [0.0, 0.0, 0.0]
+
+    def test_clipped_to_one(self):
+        assert _rms_levels(np.ones(64, dtype=np.float32), 4) == [1.0] * 4
+
 
 # ---------------------------------------------------------------------------
 # cancel — must delete files, not just stop
@@ -164,6 +289,59 @@ class TestCancel:
         svc.cancel()
         assert svc._wav_path is None
 
+    def test_cancel_without_wait_deletes_in_background(self, svc, tmp_path):
+        wav = tmp_path / "rec.wav"
+        wav.write_bytes(b"RIFF" + b"\x00" * 36)
+        _mock_active_session(svc, str(wav))
+        svc.cancel(wait=False)
+        svc.wait_for_discard()
+        assert not wav.exists()
+        assert svc._session is None
+
+    def test_start_waits_for_background_discard(self, svc, tmp_path):
+        wav = tmp_path / "rec.wav"
+        wav.write_bytes(b"RIFF" + b"\x00" * 36)
+        _mock_active_session(svc, str(wav))
+        svc.cancel(wait=False)
+        with patch("liscribe.services.audio_service.RecordingSession") as MockSession:
+            MockSession.return_value._stop_requested = threading.Event()
+            MockSession.return_value.start.return_value = None
+            svc.start()
+            assert not wav.exists()
+            svc.stop()
+
+    def test_discard_finishes_when_interpreter_exits_mid_discard(self, tmp_path):
+        """Quitting right after a background discard must still delete the WAV."""
+        wav = tmp_path / "rec.wav"
+        wav.write_bytes(b"RIFF" + b"\x00" * 36)
+        script = textwrap.dedent(f"""
+            import threading, time
+            from unittest.mock import MagicMock
+            from liscribe.services.audio_service import AudioService
+
+            svc = AudioService(MagicMock())
+            session = MagicMock()
+            session._stop_requested = threading.Event()
+            thread = MagicMock()
+            # The stop (stream close + WAV write) is still running at exit.
+            thread.join.side_effect = lambda timeout=None: time.sleep(0.5)
+            svc._session = session
+            svc._thread = thread
+            svc._wav_path = {str(wav)!r}
+            svc.cancel(wait=False)
+        """)
+        subprocess.run(
+            [sys.executable, "-c", script],
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+            check=True,
+            timeout=30,
+        )
+        assert not wav.exists()
+
+    def test_cancel_without_wait_on_idle_is_safe(self, svc):
+        svc.cancel(wait=False)
+        assert svc._discard_thread is None
+
     def test_stop_does_not_delete_file(self, svc, tmp_path):
         """stop() preserves the file; cancel() deletes it."""
         wav = tmp_path / "rec.wav"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import patch
 
 import pytest
@@ -176,3 +177,38 @@ class TestTypedProperties:
     def test_rec_binary_path_setter(self, svc):
         svc.rec_binary_path = "/usr/local/bin/rec"
         assert svc.rec_binary_path == "/usr/local/bin/rec"
+
+
+# ---------------------------------------------------------------------------
+# start_on_login (ui_prefs.json)
+# ---------------------------------------------------------------------------
+
+class TestStartOnLogin:
+    @pytest.fixture()
+    def prefs_path(self, svc, tmp_path, monkeypatch):
+        path = tmp_path / ".config" / "liscribe" / "ui_prefs.json"
+        monkeypatch.setattr("liscribe.services.config_service.UI_PREFS_PATH", path)
+        monkeypatch.setattr("liscribe.services.config_service._LAUNCHD_PLIST", tmp_path / "missing.plist")
+        return path
+
+    def test_setter_round_trips(self, svc, prefs_path):
+        svc.start_on_login = True
+        assert svc.start_on_login is True
+        svc.start_on_login = False
+        assert svc.start_on_login is False
+
+    def test_setter_keeps_other_prefs(self, svc, prefs_path):
+        prefs_path.parent.mkdir(parents=True, exist_ok=True)
+        prefs_path.write_text('{"other": 1}', encoding="utf-8")
+        svc.start_on_login = True
+        assert json.loads(prefs_path.read_text(encoding="utf-8")) == {"other": 1, "start_on_login": True}
+
+    def test_setter_leaves_no_temp_file(self, svc, prefs_path):
+        svc.start_on_login = True
+        assert [p.name for p in prefs_path.parent.iterdir() if p.name.startswith("ui_prefs")] == ["ui_prefs.json"]
+
+    def test_setter_replaces_corrupt_prefs(self, svc, prefs_path):
+        prefs_path.parent.mkdir(parents=True, exist_ok=True)
+        prefs_path.write_text("{not json", encoding="utf-8")
+        svc.start_on_login = True
+        assert json.loads(prefs_path.read_text(encoding="utf-8")) == {"start_on_login": True}
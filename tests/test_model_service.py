@@ -1,13 +1,15 @@
-"""Tests for ModelService — model discovery, download, and removal."""
+"""Tests for ModelService — model discovery, download, removal, and transcription."""
 
 from __future__ import annotations
 
+import threading
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from liscribe.services.config_service import ConfigService
-from liscribe.services.model_service import ModelService
+from liscribe.services.model_service import ModelService, _load_dual_source_session
 
 
 @pytest.fixture()
@@ -95,6 +97,31 @@ class TestIsDownloaded:
             svc.is_downloaded("small")
         m.assert_called_once_with("small")
 
+    def test_repeat_calls_probe_disk_each_time(self, svc):
+        with patch("liscribe.services.model_service._transcriber.is_model_available", return_value=True) as m:
+            svc.is_downloaded("base")
+            svc.is_downloaded("base")
+        assert m.call_count == 2
+
+    def test_model_deleted_outside_app_is_reported_missing(self, svc):
+        with patch("liscribe.services.model_service._transcriber.is_model_available", return_value=True):
+            assert svc.is_downloaded("base") is True
+        with patch("liscribe.services.model_service._transcriber.is_model_available", return_value=False):
+            assert svc.is_downloaded("base") is False
+
+    def test_loaded_model_skips_disk_probe(self, svc):
+        svc._loaded_models["base"] = MagicMock()
+        with patch("liscribe.services.model_service._transcriber.is_model_available", return_value=False) as m:
+            assert svc.is_downloaded("base") is True
+        m.assert_not_called()
+
+    def test_removed_model_is_probed_again(self, svc):
+        svc._loaded_models["base"] = MagicMock()
+        with patch("liscribe.services.model_service._transcriber.remove_model", return_value=(True, "ok")):
+            svc.remove("base")
+        with patch("liscribe.services.model_service._transcriber.is_model_available", return_value=False):
+            assert svc.is_downloaded("base") is False
+
 
 # ---------------------------------------------------------------------------
 # download
@@ -143,3 +170,146 @@ class TestRemove:
             ok, msg = svc.remove("tiny")
         assert ok is False
         assert "not installed" in msg
+
+
+# ---------------------------------------------------------------------------
+# _load_dual_source_session
+# ---------------------------------------------------------------------------
+
+class TestLoadDualSourceSession:
+    def _write_session(self, tmp_path, meta='{"offset_correction_seconds": 1.5}'):
+        (tmp_path / "mic.wav").write_bytes(b"")
+        (tmp_path / "speaker.wav").write_bytes(b"")
+        (tmp_path / "session.json").write_text(meta)
+
+    def test_returns_none_for_other_file_names(self, tmp_path):
+        self._write_session(tmp_path)
+        assert _load_dual_source_session(tmp_path / "speaker.wav") is None
+
+    def test_returns_none_without_session_json(self, tmp_path):
+        (tmp_path / "mic.wav").write_bytes(b"")
+        (tmp_path / "speaker.wav").write_bytes(b"")
+        assert _load_dual_source_session(tmp_path / "mic.wav") is None
+
+    def test_returns_none_without_speaker_wav(self, tmp_path):
+        self._write_session(tmp_path)
+        (tmp_path / "speaker.wav").unlink()
+        assert _load_dual_source_session(tmp_path / "mic.wav") is None
+
+    def test_no_warning_when_speaker_wav_missing(self, tmp_path, caplog):
+        (tmp_path / "mic.wav").write_bytes(b"")
+        (tmp_path / "session.json").mkdir()  # unreadable as a file
+        with caplog.at_level("WARNING", logger="liscribe.services.model_service"):
+            assert _load_dual_source_session(tmp_path / "mic.wav") is None
+        assert caplog.records == []
+
+    def test_reads_offset_from_session_json(self, tmp_path):
+        self._write_session(tmp_path)
+        dual = _load_dual_source_session(tmp_path / "mic.wav")
+        assert dual["speaker_audio_path"] == tmp_path / "speaker.wav"
+        assert dual["speaker_offset_seconds"] == 1.5
+
+    def test_malformed_session_json_logs_and_defaults_offset(self, tmp_path, caplog):
+        self._write_session(tmp_path, meta="not json")
+        with caplog.at_level("WARNING", logger="liscribe.services.model_service"):
+            dual = _load_dual_source_session(tmp_path / "mic.wav")
+        assert dual["speaker_offset_seconds"] == 0.0
+        assert "session.json" in caplog.text
+
+
+# ---------------------------------------------------------------------------
+# transcribe — dual-source sessions
+# ---------------------------------------------------------------------------
+
+class TestTranscribeDualSource:
+    @pytest.fixture()
+    def session_dir(self, tmp_path):
+        (tmp_path / "mic.wav").write_bytes(b"")
+        (tmp_path / "speaker.wav").write_bytes(b"")
+        (tmp_path / "session.json").write_text('{"offset_correction_seconds": 0.25}')
+        return tmp_path
+
+    def test_transcribes_both_streams_and_merges(self, svc, session_dir):
+        with patch("liscribe.services.model_service._transcriber.load_model"), \
+             patch("liscribe.services.model_service._transcriber.transcribe") as tr, \
+             patch("liscribe.services.model_service.build_merged_transcription_result") as merge:
+            tr.side_effect = lambda audio_path, **kw: f"result:{Path(audio_path).name}"
+            svc.transcribe(session_dir / "mic.wav", model_size="base")
+        paths = sorted(Path(c.kwargs["audio_path"]).name for c in tr.call_args_list)
+        assert paths == ["mic.wav", "speaker.wav"]
+        kwargs = merge.call_args.kwargs
+        assert kwargs["mic_result"] == "result:mic.wav"
+        assert kwargs["speaker_result"] == "result:speaker.wav"
+        assert kwargs["speaker_offset_seconds"] == 0.25
+
+    def test_speaker_stream_runs_on_another_thread(self, svc, session_dir):
+        threads = {}
+
+        def fake_transcribe(audio_path, **kw):
+            threads[Path(audio_path).name] = threading.current_thread()
+
+        with patch("liscribe.services.model_service._transcriber.load_model"), \
+             patch("liscribe.services.model_service._transcriber.transcribe", side_effect=fake_transcribe), \
+             patch("liscribe.services.model_service.build_merged_transcription_result"):
+            svc.transcribe(session_dir / "mic.wav", model_size="base")
+        assert threads["mic.wav"] is threading.current_thread()
+        assert threads["speaker.wav"] is not threading.current_thread()
+
+    def test_progress_averages_both_streams(self, svc, session_dir):
+        reported = []
+
+        def fake_transcribe(audio_path, on_progress=None, **kw):
+            on_progress(0.5)
+            on_progress(1.0)
+
+        with patch("liscribe.services.model_service._transcriber.load_model"), \
+             patch("liscribe.services.model_service._transcriber.transcribe", side_effect=fake_transcribe), \
+             patch("liscribe.services.model_service.build_merged_transcription_result"):
+            svc.transcribe(session_dir / "mic.wav", model_size="base", on_progress=reported.append)
+        assert reported == sorted(reported)
+        assert reported[-1] == 1.0
+        assert all(0.0 <= p <= 1.0 for p in reported)
+
+    def test_mic_error_propagates(self, svc, session_dir):
+        def fake_transcribe(audio_path, **kw):
+            if Path(audio_path).name == "mic.wav":
+                raise RuntimeError("decode failed")
+
+        with patch("liscribe.services.model_service._transcriber.load_model"), \
+             patch("liscribe.services.model_service._transcriber.transcribe", side_effect=fake_transcribe), \
+             patch("liscribe.services.model_service.build_merged_transcription_result") as merge:
+            with pytest.raises(RuntimeError, match="decode failed"):
+                svc.transcribe(session_dir / "mic.wav", model_size="base")
+        merge.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# transcribe — progress reporting
+# ---------------------------------------------------------------------------
+
+class TestTranscribeProgress:
+    def _run(self, svc, tmp_path, steps):
+        wav = tmp_path / "rec.wav"
+        wav.write_bytes(b"")
+        reported = []
+
+        def fake_transcribe(audio_path, on_progress=None, **kw):
+            for p in steps:
+                on_progress(p)
+
+        with patch("liscribe.services.model_service._transcriber.load_model"), \
+             patch("liscribe.services.model_service._transcriber.transcribe", side_effect=fake_transcribe):
+            svc.transcribe(wav, model_size="base", on_progress=reported.append)
+        return reported
+
+    def test_sub_percent_updates_are_coalesced(self, svc, tmp_path):
+        reported = self._run(svc, tmp_path, [i / 1000 for i in range(1000)])
+        assert len(reported) <= 101
+        assert all(b - a >= 0.01 for a, b in zip(reported, reported[1:]))
+
+    def test_completion_is_always_forwarded(self, svc, tmp_path):
+        reported = self._run(svc, tmp_path, [0.995, 0.999, 1.0])
+        assert reported == [0.995, 1.0]
+
+    def test_first_update_is_forwarded(self, svc, tmp_path):
+        assert self._run(svc, tmp_path, [0.0]) == [0.0]
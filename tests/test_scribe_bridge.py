@@ -82,6 +82,19 @@ class TestGetMics:
             assert "is_fallback_active" in entry
 
 
+class TestRefreshMics:
+    def test_delegates_to_audio_refresh_mics(self, bridge, audio_svc):
+        audio_svc.refresh_mics.return_value = [{"name": "USB Mic", "index": 2}]
+        result = bridge.refresh_mics()
+        audio_svc.refresh_mics.assert_called_once()
+        assert result[0]["name"] == "USB Mic"
+        assert "is_fallback_active" in result[0]
+
+    def test_returns_empty_list_on_error(self, bridge, audio_svc):
+        audio_svc.refresh_mics.side_effect = RuntimeError("PortAudio")
+        assert bridge.refresh_mics() == []
+
+
 # ---------------------------------------------------------------------------
 # get_models()
 # ---------------------------------------------------------------------------
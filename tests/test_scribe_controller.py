@@ -142,6 +142,24 @@ class TestStart:
         controller.start()
         assert controller.is_using_fallback_mic is False
 
+    def test_fallback_detected_before_session_start(
+        self, controller, audio_svc, config_svc
+    ):
+        config_svc.default_mic = "My USB Mic"
+        controller.start()
+        names = [c[0] for c in audio_svc.mock_calls]
+        assert names.index("preferred_mic_index") < names.index("start")
+
+    def test_enumeration_error_leaves_no_session_running(
+        self, controller, audio_svc, config_svc
+    ):
+        config_svc.default_mic = "My USB Mic"
+        audio_svc.preferred_mic_index.side_effect = RuntimeError("PortAudio error")
+        with pytest.raises(RuntimeError, match="PortAudio error"):
+            controller.start()
+        audio_svc.start.assert_not_called()
+        assert controller.state == ControllerState.IDLE
+
     def test_fallback_flag_clear_when_no_preference_set(
         self, controller, audio_svc, config_svc
     ):
@@ -177,6 +195,12 @@ class TestCancel:
         controller.start()
         assert controller._notes.notes == []
 
+    def test_passes_wait_flag_to_audio_cancel(self, controller, audio_svc):
+        _force_recording(controller)
+        controller.cancel(wait=False)
+        audio_svc.cancel.assert_called_once_with(wait=False)
+        assert controller.state == ControllerState.IDLE
+
     def test_does_not_call_audio_cancel_when_idle(self, controller, audio_svc):
         controller.cancel()
         audio_svc.cancel.assert_not_called()
@@ -286,6 +310,23 @@ class TestGetElapsed:
         controller._state = ControllerState.RECORDING
         assert controller.get_elapsed_seconds() == 0.0
 
+    def test_ignores_wall_clock_jumps_after_first_read(self, controller, audio_svc):
+        audio_svc.get_session_start_time.return_value = time.time() - 10.0
+        controller._state = ControllerState.RECORDING
+        controller.get_elapsed_seconds()
+        with patch("liscribe.controllers.scribe_controller.time.time", return_value=time.time() + 3600):
+            elapsed = controller.get_elapsed_seconds()
+        assert 9.0 <= elapsed <= 11.0
+
+    def test_new_session_re_anchors_start(self, controller, audio_svc):
+        audio_svc.get_session_start_time.return_value = time.time() - 100.0
+        controller._state = ControllerState.RECORDING
+        controller.get_elapsed_seconds()
+        controller.cancel()
+        audio_svc.get_session_start_time.return_value = time.time() - 2.0
+        controller.start()
+        assert 1.0 <= controller.get_elapsed_seconds() <= 3.0
+
 
 # ---------------------------------------------------------------------------
 # set_mic() / set_speaker() / set_save_path() / set_models()